@@ -195,8 +195,10 @@ def get_market_data():
         return None
 
 # --- arXiv 論文抓取 ---
+PAPER_HEADER = ['日期', '標題', '作者', '摘要', '連結', '相關度', 'AI摘要']
+
 def fetch_daily_papers():
-    """每天抓取最新的化學相關論文"""
+    """每天抓取最新的化學相關論文 (保留完整摘要，交給 AI 摘要使用)"""
     try:
         client = arxiv.Client()
         search = arxiv.Search(
@@ -210,7 +212,7 @@ def fetch_daily_papers():
                 result.published.strftime("%Y-%m-%d"),
                 result.title,
                 ", ".join([a.name for a in result.authors[:3]]),
-                result.summary.replace("\n", " ")[:200] + "...",
+                result.summary.replace("\n", " "),
                 result.entry_id
             ])
         return papers
@@ -218,6 +220,25 @@ def fetch_daily_papers():
         print(f"arXiv Error: {e}")
         return []
 
+def get_papers_worksheet(sh):
+    """取得 Papers 工作表，並確保有 AI 摘要欄位 (舊表自動補欄)"""
+    try:
+        ws = sh.worksheet("Papers")
+    except:
+        ws = sh.add_worksheet(title="Papers", rows=1000, cols=len(PAPER_HEADER))
+        ws.append_row(PAPER_HEADER)
+        return ws
+
+    header = ws.row_values(1)
+    missing = [h for h in PAPER_HEADER if h not in header]
+    if missing:
+        if ws.col_count < len(header) + len(missing):
+            ws.add_cols(len(header) + len(missing) - ws.col_count)
+        ws.update_cells([
+            gspread.Cell(1, len(header) + i + 1, h) for i, h in enumerate(missing)
+        ])
+    return ws
+
 def update_papers_if_new():
     if not gc: return None
     df_papers = load_data_from_gsheet("Papers")
@@ -234,29 +255,28 @@ def update_papers_if_new():
         else:
             need_update = True
 
-    if need_update:
-        new_papers = fetch_daily_papers()
-        if not new_papers: return False
+    updated = False
+    new_papers = fetch_daily_papers() if need_update else []
+    if new_papers:
         try:
             sh = gc.open("Lab_Time_Master_DB")
-            try:
-                ws = sh.worksheet("Papers")
-            except:
-                ws = sh.add_worksheet(title="Papers", rows=1000, cols=5)
-                ws.append_row(['日期', '標題', '作者', '摘要', '連結'])
-            
-            for paper in new_papers:
-                # 簡單防重複：只寫入今天的
-                if paper[0] == today_str:
-                    ws.append_row(paper)
+            ws = get_papers_worksheet(sh)
+
+            # 防重複：只寫入今天的，且 entry_id (連結) 尚未存在
+            known_ids = set(df_papers['連結']) if '連結' in df_papers.columns else set()
+            rows = [p for p in new_papers if p[0] == today_str and p[4] not in known_ids]
+            if rows:
+                ws.append_rows(rows)
             
             st.toast(f"✅ 已更新今日 ({today_str}) 論文！")
             st.cache_data.clear()
-            return True
+            updated = True
         except Exception as e:
             st.error(f"論文更新失敗: {e}")
-            return False
-    return False
+
+    # 每日摘要：只處理尚未摘要過的論文 (一次批次呼叫)，抓取失敗時也照樣補摘要
+    digest_pending_papers()
+    return updated
 
 # ============================================================
 # 🤖 AI 強化版核心函式
@@ -301,7 +321,123 @@ def fetch_ai_daily_tasks(weekday_str):
     except:
         return None
 
-# --- 2. AI 單字測驗 (防重複 & 隨機情境) ---
+# --- 2. AI 論文每日摘要 (批次 + 存表快取) ---
+PAPER_DIGEST_MAX_ATTEMPTS = 3  # AI 漏回/格式錯誤的論文最多重送幾次，之後標記 N/A 不再處理
+
+def fetch_ai_paper_digest(papers):
+    """一次送出所有論文，回傳 {清單位置: {"score": int, "summary": str}}；呼叫失敗回傳 None"""
+    if not ai_client or not papers: return None
+
+    # 使用簡短的序號當 id，避免 AI 改寫網址造成對不上
+    paper_list = "\n\n".join(
+        f"[{i}]\n標題：{p['title']}\n摘要：{p['abstract']}" for i, p in enumerate(papers, 1)
+    )
+    prompt = f"""
+    角色：有機金屬化學 (organometallic chemistry) 研究生的文獻助理。
+    任務：針對以下每篇論文，評估與有機金屬化學的相關度 (0-10 整數)，並寫一句繁體中文重點摘要 (30 字內)。
+    論文清單：
+    {paper_list}
+
+    回傳格式：JSON Array，每篇一筆，id 為清單中 [] 內的數字
+    [
+        {{"id": 1, "score": 7, "summary": "一句話摘要"}}
+    ]
+    """
+    try:
+        response = ai_client.models.generate_content(
+            model='gemini-2.5-flash',
+            contents=prompt,
+            config=types.GenerateContentConfig(response_mime_type="application/json")
+        )
+        if not response.text: return None
+        items = json.loads(response.text)
+    except Exception as e:
+        print(f"Paper Digest Error: {e}")
+        return None
+
+    digest = {}
+    for item in items if isinstance(items, list) else []:
+        try:
+            pos = int(str(item['id']).strip().strip("[]").strip()) - 1
+            score = max(0, min(10, int(item['score'])))
+        except (KeyError, TypeError, ValueError):
+            continue
+        summary = item.get('summary')
+        if not isinstance(summary, str) or not summary.strip():
+            continue  # 沒有摘要視同漏回，走重試流程
+        if 0 <= pos < len(papers):
+            digest[pos] = {"score": score, "summary": summary.strip()}
+    return digest
+
+def next_digest_marker(value):
+    """相關度欄的重試標記：空白 -> ?1 -> ?2 ... -> N/A"""
+    value = str(value).strip()
+    attempts = int(value[1:]) if value.startswith("?") and value[1:].isdigit() else 0
+    attempts += 1
+    return "N/A" if attempts >= PAPER_DIGEST_MAX_ATTEMPTS else f"?{attempts}"
+
+def digest_pending_papers(batch_size=30):
+    """找出 Papers 表中尚未有 AI摘要 的論文，批次摘要後寫回對應欄位"""
+    if not gc or not ai_client: return 0
+    df = load_data_from_gsheet("Papers")
+    if df.empty or '連結' not in df.columns: return 0
+
+    if '相關度' in df.columns:
+        scores = df['相關度'].astype(str).str.strip()
+        pending = df[(scores == "") | scores.str.startswith("?")]
+    else:
+        pending = df
+    # 最新的論文優先 (表格依日期往下新增)，同一連結只送一次
+    pending = pending[pending['連結'].astype(str).str.strip() != ""].iloc[::-1]
+    pending = pending.drop_duplicates(subset='連結').head(batch_size)
+    if pending.empty: return 0
+
+    rows = [row for _, row in pending.iterrows()]
+    papers = [{"title": row.get('標題', ''), "abstract": row.get('摘要', '')} for row in rows]
+    digest = fetch_ai_paper_digest(papers)
+    if digest is None: return 0
+
+    try:
+        sh = gc.open("Lab_Time_Master_DB")
+        ws = get_papers_worksheet(sh)
+        header = ws.row_values(1)
+        link_col = header.index('連結') + 1
+        score_col = header.index('相關度') + 1
+        summary_col = header.index('AI摘要') + 1
+
+        # 用最新的連結欄定位列號，避免快取資料過期或手動調整列順序時寫錯列；
+        # 重複的連結會對應到多列，全部一起寫入
+        # (已有分數的列不覆蓋)
+        current_scores = ws.col_values(score_col)
+        rows_by_link = {}
+        for i, link in enumerate(ws.col_values(link_col)[1:], 2):
+            score = current_scores[i - 1].strip() if i - 1 < len(current_scores) else ""
+            if score == "" or score.startswith("?"):
+                rows_by_link.setdefault(link, []).append(i)
+
+        cells = []
+        done = 0
+        for pos, row in enumerate(rows):
+            sheet_rows = rows_by_link.get(row['連結'], [])
+            if not sheet_rows: continue
+            result = digest.get(pos)
+            marker = next_digest_marker(row.get('相關度', ''))
+            for sheet_row in sheet_rows:
+                if result:
+                    cells.append(gspread.Cell(sheet_row, score_col, result['score']))
+                    cells.append(gspread.Cell(sheet_row, summary_col, result['summary']))
+                else:
+                    cells.append(gspread.Cell(sheet_row, score_col, marker))
+            if result: done += 1
+        if cells:
+            ws.update_cells(cells)
+            st.cache_data.clear()
+        return done
+    except Exception as e:
+        st.error(f"論文摘要寫入失敗: {e}")
+        return 0
+
+# --- 3. AI 單字測驗 (防重複 & 隨機情境) ---
 def get_learned_words_history(lang):
     if not gc: return []
     try:
@@ -625,9 +761,20 @@ with tab5:
     if gc:
         df_papers = load_data_from_gsheet("Papers")
         if not df_papers.empty:
-            df_papers = df_papers.sort_values(by="日期", ascending=False).head(10)
+            # 直接使用表中已存的 AI 評分排序，渲染時不呼叫 AI
+            if '相關度' in df_papers.columns:
+                df_papers['相關度'] = pd.to_numeric(df_papers['相關度'], errors='coerce')
+            else:
+                df_papers['相關度'] = float('nan')
+            # 先取最新 10 篇，再依相關度排序 (尚未評分的排在後面)
+            df_papers = df_papers.sort_values(by="日期", ascending=False, kind="stable").head(10)
+            df_papers = df_papers.sort_values(by="相關度", ascending=False, na_position="last", kind="stable")
             for _, row in df_papers.iterrows():
-                with st.expander(f"📄 {row.get('日期','')} | {row.get('標題','')}"):
+                score = row['相關度']
+                badge = f"⭐ {int(score)}/10 | " if pd.notna(score) else ""
+                with st.expander(f"📄 {badge}{row.get('日期','')} | {row.get('標題','')}"):
+                    if row.get('AI摘要', ''):
+                        st.info(f"🤖 {row.get('AI摘要','')}")
                     st.write(f"**作者:** {row.get('作者','')}")
                     st.write(f"**摘要:** {row.get('摘要','')}")
                     st.markdown(f"[🔗 閱讀原文]({row.get('連結','')})")